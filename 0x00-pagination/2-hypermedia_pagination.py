@@ -13,22 +13,34 @@ Classes:
 Functions:
     - dataset() -> List[List]: Returns the cached dataset, loading it from
       the CSV file if necessary.
-    - index_range(page: int, page_size: int) -> Tuple[int, int]: Computes the
-      start and end indices for pagination.
     - get_page(page: int, page_size: int) -> List[List]: Retrieves a specific
       page of data from the dataset.
+    - iter_pages(page_size: int) -> Iterator[List[List]]: Yields every page
+      of the dataset in order.
     - get_hyper(page: int, page_size: int) -> dict: Retrieves a specific page
       of data along with hypermedia metadata.
+    - get_hyper_bytes(page: int, page_size: int) -> bytes: Retrieves the same
+      page and metadata as `get_hyper`, already encoded as JSON.
 """
 
 import csv
+import io
+import itertools
+import json
 import math
-from typing import List, Tuple, Dict, Any
+import mmap
+import os
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 
 class Server:
     """Server: Handles the loading and pagination of the baby names dataset."""
     DATA_FILE = "Popular_Baby_Names.csv"
+    ENCODING = "utf-8"
+    STREAM_LIMIT = 1000
+    CACHE_SIZE = 1024
 
     def __init__(self):
         """
@@ -36,6 +48,12 @@ class Server:
         set to None.
         """
         self.__dataset = None
+        self.__mm = None
+        self.__offsets = None
+        self.__nrows = None
+        self.__page_cache = OrderedDict()
+        self.__total_pages: Dict[int, int] = {}
+        self.__page_json = OrderedDict()
 
     def dataset(self) -> List[List]:
         """
@@ -43,42 +61,212 @@ class Server:
 
         If the dataset is not already loaded, it reads the data from the
         'Popular_Baby_Names.csv' file, skipping the header row, and caches it.
+        The file is read through a 1 MiB buffer, and the number of rows is
+        recorded at load time.
 
         Returns:
             List[List]: The dataset as a list of lists, where each inner list
             represents a row in the CSV file.
         """
         if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
+            with open(self.DATA_FILE, encoding=self.ENCODING, newline='',
+                      buffering=1 << 20) as f:
                 reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+                next(reader, None)
+                self.__dataset = list(reader)
+            self.__nrows = len(self.__dataset)
 
         return self.__dataset
 
-    @staticmethod
-    def index_range(page: int, page_size: int) -> Tuple[int, int]:
+    def _record_offsets(self, mm: mmap.mmap) -> array:
         """
-        Computes the start and end indices for a given page and page size.
+        Returns the byte offsets of the records in a memory-mapped CSV file.
+
+        The file is fed to `csv.reader` one physical line at a time, and
+        the position reached after each record is recorded. The reader
+        never asks for more lines than the record it is parsing needs, so
+        a quoted field spanning several lines stays in a single record.
+
+        Args:
+            mm (mmap.mmap): The memory-mapped CSV file.
+
+        Returns:
+            array: The offsets of each record, header included, with the
+            size of the file as the last element.
+        """
+        offsets = array('Q', [0])
+        size = len(mm)
+        pos = 0
+
+        def lines() -> Iterator[str]:
+            nonlocal pos
+            while pos < size:
+                newline = mm.find(b'\n', pos)
+                end = size if newline == -1 else newline + 1
+                line = mm[pos:end].decode(self.ENCODING)
+                pos = end
+                yield line
+
+        for _ in csv.reader(lines()):
+            offsets.append(pos)
+
+        return offsets
+
+    def _index(self) -> array:
+        """
+        Returns the byte offsets of the records in the CSV file.
+
+        On first access the file is memory-mapped and scanned once. The
+        offset of every record start is stored in a compact array (8 bytes
+        per row), followed by the end of the file, so that any row can be
+        located without parsing the rows before it. A file without quote
+        characters holds one record per physical line, and is indexed by
+        a plain newline scan. Otherwise a field may contain a newline, so
+        the record boundaries are taken from `_record_offsets`. An empty
+        file cannot be mapped, and yields an index with no rows.
+
+        Returns:
+            array: The offsets of each record, header included, with the
+            size of the file as the last element.
+        """
+        if self.__offsets is None:
+            with open(self.DATA_FILE, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self.__offsets = array('Q', [0])
+                    self.__nrows = 0
+                    return self.__offsets
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if mm.find(b'"') == -1:
+                offsets = array('Q', [0])
+                pos = mm.find(b'\n')
+                while pos != -1:
+                    offsets.append(pos + 1)
+                    pos = mm.find(b'\n', pos + 1)
+                if offsets[-1] != len(mm):
+                    offsets.append(len(mm))
+            else:
+                offsets = self._record_offsets(mm)
+
+            self.__mm = mm
+            self.__offsets = offsets
+            self.__nrows = len(offsets) - 2
+
+        return self.__offsets
+
+    def _stream_rows(self, start: int,
+                     end: int) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Reads rows `start` to `end` (exclusive) straight from the CSV file.
+
+        The file is read through a 1 MiB buffer and parsing stops once the
+        last requested row is reached, so none of the rows after it are
+        ever read. If the end of the file is reached first, the number of
+        rows read, which is the number of rows in the file, is recorded.
+
+        Args:
+            start (int): The index of the first row to read.
+            end (int): The index after the last row to read.
+
+        Returns:
+            Tuple[Tuple[str, ...], ...]: The requested rows.
+        """
+        with open(self.DATA_FILE, encoding=self.ENCODING, newline='',
+                  buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            skipped = sum(1 for _ in itertools.islice(reader, start))
+            rows = tuple(map(tuple, itertools.islice(reader, end - start)))
+            if len(rows) < end - start:
+                self.__nrows = skipped + len(rows)
+
+        return rows
+
+    def _read_page(self, page: int,
+                   page_size: int) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Reads a specific page of data from the CSV file.
+
+        The start and end indices are computed inline, exactly as
+        `index_range` in 0-simple_helper_function.py does, from the page
+        number and page size. If the dataset is already loaded, the page is
+        sliced from it. Otherwise only the lines belonging to the requested
+        page are read from the memory-mapped file and parsed, building the
+        record index on first use. Pages ending within the first
+        `STREAM_LIMIT` rows are streamed from the file instead while the
+        index does not exist yet, so a few shallow reads never scan the
+        whole file.
 
         Args:
-            page (int): The page number (1-indexed).
+            page (int): The page number to read.
             page_size (int): The number of items per page.
 
         Returns:
-            Tuple[int, int]: A tuple containing the start and end indices
-            for the dataset.
+            Tuple[Tuple[str, ...], ...]: The rows of the page, immutable so
+            that they can be cached.
         """
         start = (page - 1) * page_size
         end = start + page_size
-        return (start, end)
+
+        if self.__dataset is not None:
+            return tuple(map(tuple, self.__dataset[start:end]))
+
+        offsets = self.__offsets
+        if offsets is None:
+            if end <= self.STREAM_LIMIT:
+                return self._stream_rows(start, end)
+            offsets = self._index()
+
+        if start >= self.__nrows:
+            return ()
+        end = min(end, self.__nrows)
+
+        chunk = self.__mm[offsets[start + 1]:offsets[end + 1]]
+        reader = csv.reader(
+            io.TextIOWrapper(io.BytesIO(chunk), encoding=self.ENCODING,
+                             newline='')
+        )
+        return tuple(map(tuple, reader))
+
+    def _cached(self, cache: OrderedDict, read: Callable[[int, int], Any],
+                page: int, page_size: int) -> Any:
+        """
+        Returns a cached result for a page, reading it on a miss.
+
+        The cache holds the `CACHE_SIZE` most recently used pages and
+        evicts the least recently used one. The reader is passed in rather
+        than stored with the cache, so the cache holds no reference back
+        to the server.
+
+        Args:
+            cache (OrderedDict): The cache, keyed by (page, page_size).
+            read (Callable[[int, int], Any]): Computes the result on a miss.
+            page (int): The page number.
+            page_size (int): The number of items per page.
+
+        Returns:
+            Any: The cached or newly read result.
+        """
+        key = (page, page_size)
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        value = read(page, page_size)
+        cache[key] = value
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return value
 
     def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
         """
         Retrieves a specific page of data from the dataset.
 
-        This method uses the `index_range` method to calculate the correct
-        slice of the dataset based on the page number and page size.
+        The rows are read with `_read_page`, and the most recently requested
+        pages are cached, so a repeated request does not touch the file. Once
+        the number of rows is known, pages past the end of the dataset
+        return immediately.
 
         Args:
             page (int, optional): The page number to retrieve (default is 1).
@@ -95,21 +283,84 @@ class Server:
         assert isinstance(page, int) and page > 0
         assert isinstance(page_size, int) and page_size > 0
 
-        start, end = self.index_range(page, page_size)
-        dataset = self.dataset()
-
-        try:
-            return dataset[start:end]
-        except IndexError:
+        nrows = self.__nrows
+        if nrows is not None and (page - 1) * page_size >= nrows:
             return []
 
+        rows = self._cached(self.__page_cache, self._read_page,
+                            page, page_size)
+        return list(map(list, rows))
+
+    def iter_pages(self, page_size: int = 10) -> Iterator[List[List]]:
+        """
+        Yields every page of the dataset in order.
+
+        Rows are taken from the loaded dataset if there is one and streamed
+        from the CSV file otherwise, so walking all pages neither loads the
+        whole file nor slices it once per page.
+
+        Args:
+            page_size (int, optional): The number of items per page
+            (default is 10).
+
+        Yields:
+            List[List]: The rows of each page. Only the last page may hold
+            fewer than `page_size` rows.
+
+        Raises:
+            AssertionError: If `page_size` is not a positive integer.
+        """
+        assert isinstance(page_size, int) and page_size > 0
+
+        if self.__dataset is not None:
+            rows = iter(self.__dataset)
+            while True:
+                chunk = list(itertools.islice(rows, page_size))
+                if not chunk:
+                    return
+                yield chunk
+
+        with open(self.DATA_FILE, encoding=self.ENCODING, newline='',
+                  buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            while True:
+                chunk = list(itertools.islice(reader, page_size))
+                if not chunk:
+                    return
+                yield chunk
+
+    def _total_pages(self, page_size: int) -> int:
+        """
+        Returns the total number of pages for a given page size.
+
+        The result is computed once per page size and cached. The row
+        count recorded when the dataset or the line index was loaded is
+        used, and the line index is built only if neither exists yet.
+
+        Args:
+            page_size (int): The number of items per page.
+
+        Returns:
+            int: The total number of pages in the dataset.
+        """
+        total_pages = self.__total_pages.get(page_size)
+        if total_pages is None:
+            if self.__nrows is None:
+                self._index()
+            total_pages = -(-self.__nrows // page_size)
+            self.__total_pages[page_size] = total_pages
+
+        return total_pages
+
     def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
         """
         Retrieves a specific page of data along with hypermedia metadata.
 
         This method provides pagination data in a format that includes
         additional metadata like the total number of pages, next page, and
-        previous page links.
+        previous page links. The total number of pages is computed once per
+        page size and cached.
 
         Args:
             page (int, optional): The page number to retrieve (default is 1).
@@ -118,7 +369,8 @@ class Server:
 
         Returns:
             Dict[str, Any]: A dictionary containing the following keys:
-                - page_size: The number of items on the current page.
+                - page_size: The number of items on the current page, which
+                  is 0 for a page past the end of the dataset.
                 - page: The current page number.
                 - data: The list of rows for the current page.
                 - next_page: The next page number if it exists, else None.
@@ -126,9 +378,9 @@ class Server:
                 - total_pages: The total number of pages in the dataset.
         """
         data = self.get_page(page, page_size)
-        total_pages = (len(self.dataset()) + page_size - 1) // page_size
+        total_pages = self._total_pages(page_size)
 
-        metadata = {
+        return {
                 "page_size": len(data),
                 "page": page,
                 "data": data,
@@ -137,4 +389,50 @@ class Server:
                 "total_pages": total_pages
         }
 
-        return metadata
+    def _encode_page(self, page: int, page_size: int) -> Tuple[int, bytes]:
+        """
+        Retrieves a page of data and encodes it as JSON.
+
+        Args:
+            page (int): The page number to retrieve.
+            page_size (int): The number of items per page.
+
+        Returns:
+            Tuple[int, bytes]: The number of rows on the page and the rows
+            encoded as a JSON array.
+        """
+        data = self.get_page(page, page_size)
+        return len(data), json.dumps(data, separators=(',', ':')).encode()
+
+    def get_hyper_bytes(self, page: int = 1, page_size: int = 10) -> bytes:
+        """
+        Retrieves a specific page of data along with hypermedia metadata,
+        encoded as a JSON object.
+
+        The result has the same keys as `get_hyper`. The encoded rows of the
+        most recently requested pages are cached, so a repeated request only
+        splices integers into a prebuilt bytes template.
+
+        Args:
+            page (int, optional): The page number to retrieve (default is 1).
+            page_size (int, optional): The number of items per page
+            (default is 10).
+
+        Returns:
+            bytes: The JSON-encoded page and metadata.
+        """
+        count, data = self._cached(self.__page_json, self._encode_page,
+                                   page, page_size)
+        total_pages = self._total_pages(page_size)
+
+        return (
+            b'{"page_size":%d,"page":%d,"data":%b,'
+            b'"next_page":%b,"prev_page":%b,"total_pages":%d}' % (
+                count,
+                page,
+                data,
+                b'%d' % (page + 1) if page < total_pages else b'null',
+                b'%d' % (page - 1) if page > 1 else b'null',
+                total_pages,
+            )
+        )
@@ -24,10 +24,10 @@ class Server:
         """Cached dataset
         """
         if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
+            with open(self.DATA_FILE, newline='', buffering=1 << 20) as f:
                 reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+                next(reader, None)
+                self.__dataset = list(reader)
 
         return self.__dataset
 
@@ -43,7 +43,8 @@ class BasicCache(BaseCaching):
         Retrieves an item from the cache.
 
         If the key is None or does not exist in the cache,
-        the method returns None.
+        the method returns None. put never stores a None key or item, so
+        a plain dictionary lookup covers both cases.
 
         Args:
             key: The key corresponding to the item to be retrieved.
@@ -51,7 +52,4 @@ class BasicCache(BaseCaching):
         Returns:
             The item stored under the key, or None if the key is invalid.
         """
-        if key is None:
-            return None
-
         return self.cache_data.get(key)
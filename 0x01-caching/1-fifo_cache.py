@@ -7,14 +7,14 @@ This module provides a FIFO (First-In-First-Out) caching class that extends
 the BaseCaching class.
 The FIFOCache class implements a basic caching strategy where the oldest
 items are discarded when the cache reaches its maximum capacity. It allows
-storing and retrieving items using a dictionary, with an additional list to
-track the order of item insertion.
+storing and retrieving items using an OrderedDict, which also tracks the
+order of item insertion.
 
 Classes:
     - FIFOCache: Implements FIFO caching strategy with put and get methods.
 """
 from typing import Any, Union
-
+from collections import OrderedDict
 from base_caching import BaseCaching
 
 
@@ -28,25 +28,26 @@ class FIFOCache(BaseCaching):
     reaches its maximum capacity.
 
     Attributes:
-        keys (List[Any]): A list that tracks the order of keys for eviction.
+        cache_data (OrderedDict): An ordered dictionary that tracks the
+                                  order of key insertion for eviction.
     """
 
     def __init__(self):
         """
         Initializes the FIFOCache instance.
 
-        Sets up the cache with an empty dictionary and an empty list
-        to keep track of the order of keys.
+        Sets up the cache with an empty OrderedDict to keep track of the
+        order of keys.
         """
         super().__init__()
-        self.keys = []
+        self.cache_data = OrderedDict()
 
     def put(self, key: Any, item: Any) -> None:
         """
         Adds an item to the cache using FIFO policy.
 
         If the key already exists in the cache, it updates the item
-        and moves the key to the end of the order list. If the key
+        and moves the key to the end of the order. If the key
         does not exist and the cache is full, it discards the oldest
         item.
 
@@ -58,16 +59,13 @@ class FIFOCache(BaseCaching):
             return
 
         if key in self.cache_data:
+            self.cache_data.move_to_end(key)
             self.cache_data[key] = item
-            self.keys.remove(key)
-            self.keys.append(key)
         else:
             if len(self.cache_data) >= self.MAX_ITEMS:
-                oldest_key = self.keys.pop(0)
-                del self.cache_data[oldest_key]
-                print(f"DISCARD: {oldest_key}")
+                oldest_key, _ = self.cache_data.popitem(last=False)
+                self._discard(oldest_key)
 
-            self.keys.append(key)
             self.cache_data[key] = item
 
     def get(self, key: Any) -> Union[Any, None]:
@@ -75,7 +73,8 @@ class FIFOCache(BaseCaching):
         Retrieves an item from the cache.
 
         If the key is None or does not exist in the cache,
-        the method returns None.
+        the method returns None. put never stores a None key or item, so
+        a plain dictionary lookup covers both cases.
 
         Args:
             key: The key corresponding to the item to be retrieved.
@@ -83,7 +82,4 @@ class FIFOCache(BaseCaching):
         Returns:
             The item stored under the key, or None if the key is invalid.
         """
-        if key is None:
-            return None
-
         return self.cache_data.get(key)
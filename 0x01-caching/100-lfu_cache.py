@@ -15,8 +15,8 @@ Classes:
     get items.
 """
 
-from typing import Any, Union
-from collections import OrderedDict
+from typing import Any, List, Union
+
 from base_caching import BaseCaching
 
 
@@ -30,47 +30,51 @@ class LFUCache(BaseCaching):
     the LRU (Least Recently Used) policy as a tie-breaker.
 
     Attributes:
-        cache_data (OrderedDict): Stores the cache data with keys and values.
-        freq_map (dict): Maps keys to their access frequency.
-        order_map (dict): Maps frequencies to OrderedDicts of keys, tracking
-                          the order of access within each frequency.
+        cache_data (dict): Maps keys to [item, frequency] nodes, so a
+                           single lookup yields both.
+        order_map (dict): Maps frequencies to dicts of keys, whose insertion
+                          order tracks the order of access within each
+                          frequency.
+        _min_freq (int): The lowest access frequency currently in the cache.
     """
     def __init__(self):
         """
         Initializes the LFUCache instance.
 
-        Sets up the cache with an empty OrderedDict for cache data,
-        an empty dictionary for frequency mapping, and an empty dictionary
-        for order mapping.
+        Sets up the cache with an empty dictionary for cache data and an
+        empty dictionary for order mapping.
         """
         super().__init__()
-        self.cache_data = OrderedDict()
-        self.freq_map = {}
+        self.cache_data = {}
         self.order_map = {}
+        self._min_freq = 0
 
-    def _update_freq(self, key: Any) -> None:
+    def _update_freq(self, key: Any, node: List) -> None:
         """
         Updates the frequency of a key in the cache.
 
-        This method increments the access frequency of the given key
-        and moves it to the appropriate position in the order map.
+        This method increments the access frequency stored in the key's node
+        and moves it to the appropriate position in the order map. If this
+        empties the bucket of the lowest frequency, the minimum frequency
+        moves up to the key's new frequency.
 
         Args:
             key: The key whose frequency is to be updated.
+            node: The [item, frequency] node stored under the key.
         """
-        if key in self.cache_data:
-            freq = self.freq_map.get(key, 0)
-            self.freq_map[key] = freq + 1
+        freq = node[1]
+        node[1] = new_freq = freq + 1
 
-            if freq in self.order_map:
-                del self.order_map[freq][key]
-                if not self.order_map[freq]:
-                    del self.order_map[freq]
+        bucket = self.order_map[freq]
+        del bucket[key]
+        if not bucket:
+            del self.order_map[freq]
+            if freq == self._min_freq:
+                self._min_freq = new_freq
 
-            new_freq = freq + 1
-            if new_freq not in self.order_map:
-                self.order_map[new_freq] = OrderedDict()
-            self.order_map[new_freq][key] = None
+        if new_freq not in self.order_map:
+            self.order_map[new_freq] = {}
+        self.order_map[new_freq][key] = None
 
     def put(self, key: Any, item: Any) -> None:
         """
@@ -88,28 +92,28 @@ class LFUCache(BaseCaching):
         if key is None or item is None:
             return
 
-        if key in self.cache_data:
-            self.cache_data[key] = item
-            self._update_freq(key)
+        node = self.cache_data.get(key)
+        if node is not None:
+            node[0] = item
+            self._update_freq(key, node)
         else:
             if len(self.cache_data) >= self.MAX_ITEMS:
-                min_freq = min(self.order_map.keys())
-                lfu_items = self.order_map[min_freq]
+                lfu_items = self.order_map[self._min_freq]
 
                 if lfu_items:
-                    lru_key, _ = lfu_items.popitem(last=False)
-                    print(f"DISCARD: {lru_key}")
+                    lru_key = next(iter(lfu_items))
+                    del lfu_items[lru_key]
+                    self._discard(lru_key)
                     del self.cache_data[lru_key]
-                    del self.freq_map[lru_key]
 
-                if not self.order_map[min_freq]:
-                    del self.order_map[min_freq]
+                if not lfu_items:
+                    del self.order_map[self._min_freq]
 
-            self.cache_data[key] = item
-            self.freq_map[key] = 1
+            self.cache_data[key] = [item, 1]
             if 1 not in self.order_map:
-                self.order_map[1] = OrderedDict()
+                self.order_map[1] = {}
             self.order_map[1][key] = None
+            self._min_freq = 1
 
     def get(self, key: Any) -> Union[Any, None]:
         """
@@ -125,8 +129,17 @@ class LFUCache(BaseCaching):
         Returns:
             The item stored under the key, or None if the key is invalid.
         """
-        if key in self.cache_data:
-            self._update_freq(key)
-            return self.cache_data[key]
+        node = self.cache_data.get(key)
+        if node is None:
+            return None
+
+        self._update_freq(key, node)
+        return node[0]
 
-        return None
+    def print_cache(self) -> None:
+        """
+        Prints the cache, showing the items stored in each node.
+        """
+        print("Current cache:")
+        for key in sorted(self.cache_data.keys()):
+            print("{}: {}".format(key, self.cache_data[key][0]))
@@ -7,14 +7,14 @@ This module provides a LIFO (Last-In-First-Out) caching class that extends
 the BaseCaching class.
 The LIFOCache class implements a caching strategy where the most recently
 added items are discarded when the cache reaches its maximum capacity.
-It allows storing and retrieving items using a dictionary, with an
-additional list to track the order of item insertion.
+It allows storing and retrieving items using an OrderedDict, which also
+tracks the order of item insertion.
 
 Classes:
     - LIFOCache: Implements LIFO caching strategy with put and get methods.
 """
 from typing import Any, Union
-
+from collections import OrderedDict
 from base_caching import BaseCaching
 
 
@@ -28,25 +28,26 @@ class LIFOCache(BaseCaching):
     when the cache reaches its maximum capacity.
 
     Attributes:
-        keys (List[Any]): A list that tracks the order of keys for eviction.
+        cache_data (OrderedDict): An ordered dictionary that tracks the
+                                  order of key insertion for eviction.
     """
 
     def __init__(self):
         """
         Initializes the LIFOCache instance.
 
-        Sets up the cache with an empty dictionary and an empty list
-        to keep track of the order of keys.
+        Sets up the cache with an empty OrderedDict to keep track of the
+        order of keys.
         """
         super().__init__()
-        self.keys = []
+        self.cache_data = OrderedDict()
 
     def put(self, key: Any, item: Any) -> None:
         """
         Adds an item to the cache using LIFO policy.
 
         If the key already exists in the cache, it updates the item
-        and moves the key to the end of the order list. If the key
+        and moves the key to the end of the order. If the key
         does not exist and the cache is full, it discards the most
         recently added item.
 
@@ -58,16 +59,13 @@ class LIFOCache(BaseCaching):
             return
 
         if key in self.cache_data:
+            self.cache_data.move_to_end(key)
             self.cache_data[key] = item
-            self.keys.remove(key)
-            self.keys.append(key)
         else:
             if len(self.cache_data) >= self.MAX_ITEMS:
-                recent_key = self.keys.pop()
-                del self.cache_data[recent_key]
-                print(f"DISCARD: {recent_key}")
+                recent_key, _ = self.cache_data.popitem(last=True)
+                self._discard(recent_key)
 
-            self.keys.append(key)
             self.cache_data[key] = item
 
     def get(self, key: Any) -> Union[Any, None]:
@@ -75,7 +73,8 @@ class LIFOCache(BaseCaching):
         Retrieves an item from the cache.
 
         If the key is None or does not exist in the cache,
-        the method returns None.
+        the method returns None. put never stores a None key or item, so
+        a plain dictionary lookup covers both cases.
 
         Args:
             key: The key corresponding to the item to be retrieved.
@@ -83,7 +82,4 @@ class LIFOCache(BaseCaching):
         Returns:
             The item stored under the key, or None if the key is invalid.
         """
-        if key is None:
-            return None
-
         return self.cache_data.get(key)
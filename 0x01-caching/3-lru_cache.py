@@ -63,7 +63,7 @@ class LRUCache(BaseCaching):
         else:
             if len(self.cache_data) >= self.MAX_ITEMS:
                 oldest_key, _ = self.cache_data.popitem(last=False)
-                print(f"DISCARD: {oldest_key}")
+                self._discard(oldest_key)
 
             self.cache_data[key] = item
 
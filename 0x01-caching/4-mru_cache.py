@@ -7,14 +7,14 @@ This module provides an MRU (Most Recently Used) caching class that extends
 the BaseCaching class.
 The MRUCache class implements a caching strategy where the most recently
 used items are discarded when the cache reaches its maximum capacity.
-It allows storing and retrieving items using a dictionary, with an
-OrderedDict to track the order of access.
+It allows storing and retrieving items using a dictionary, whose insertion
+order tracks the order of access.
 
 Classes:
     - MRUCache: Implements MRU caching strategy with put and get methods.
 """
 from typing import Any, Union
-from collections import OrderedDict
+
 from base_caching import BaseCaching
 
 
@@ -28,19 +28,19 @@ class MRUCache(BaseCaching):
     when the cache reaches its maximum capacity.
 
     Attributes:
-        cache_data (OrderedDict): An ordered dictionary that tracks the
-                                  order of key access for eviction.
+        cache_data (dict): A dictionary whose insertion order tracks the
+                           order of key access for eviction.
     """
 
     def __init__(self):
         """
-        Initializes the LRUCache instance.
+        Initializes the MRUCache instance.
 
-        Sets up the cache with an empty OrderedDict to keep track of the
-        order of key access.
+        Sets up the cache with an empty dictionary, re-inserting keys on
+        access to keep track of the order of key access.
         """
         super().__init__()
-        self.cache_data = OrderedDict()
+        self.cache_data = {}
 
     def put(self, key: Any, item: Any) -> None:
         """
@@ -58,12 +58,12 @@ class MRUCache(BaseCaching):
             return
 
         if key in self.cache_data:
-            self.cache_data.move_to_end(key)
+            del self.cache_data[key]
             self.cache_data[key] = item
         else:
             if len(self.cache_data) >= self.MAX_ITEMS:
-                recent_key, _ = self.cache_data.popitem(last=True)
-                print(f"DISCARD: {recent_key}")
+                recent_key, _ = self.cache_data.popitem()
+                self._discard(recent_key)
 
             self.cache_data[key] = item
 
@@ -80,8 +80,9 @@ class MRUCache(BaseCaching):
         Returns:
             The item stored under the key, or None if the key is invalid.
         """
-        if key in self.cache_data:
-            self.cache_data.move_to_end(key)
-            return self.cache_data[key]
+        item = self.cache_data.pop(key, None)
+        if item is None:
+            return None
 
-        return None
+        self.cache_data[key] = item
+        return item
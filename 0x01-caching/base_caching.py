@@ -1,14 +1,17 @@
 #!/usr/bin/python3
 """ BaseCaching module
 """
+import sys
 
 
 class BaseCaching():
     """ BaseCaching defines:
       - constants of your caching system
       - where your data are stored (in a dictionary)
+      - whether discarded keys are reported (VERBOSE)
     """
     MAX_ITEMS = 4
+    VERBOSE = True
 
     def __init__(self):
         """ Initiliaze
@@ -22,6 +25,12 @@ class BaseCaching():
         for key in sorted(self.cache_data.keys()):
             print("{}: {}".format(key, self.cache_data.get(key)))
 
+    def _discard(self, key):
+        """ Report a key evicted from the cache
+        """
+        if self.VERBOSE:
+            sys.stdout.write("DISCARD: {}\n".format(key))
+
     def put(self, key, item):
         """ Add an item in the cache
         """